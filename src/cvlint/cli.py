@@ -3,13 +3,10 @@ from typing import Optional, List
 from pathlib import Path
 from rich.console import Console
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.panel import Panel
 from rich import print as rprint
 import json
 
-from .main import create_criteria_list, Criterion, ValidationConfig
-
 app = typer.Typer(
     help="CV Linting Tool - Validate PDF resumes against quality criteria"
 )
@@ -51,6 +48,11 @@ def check(
     custom_words: Optional[str] = typer.Option(
         None, "--custom-words", help="Custom words file (one word per line)"
     ),
+    fail_fast: bool = typer.Option(
+        False,
+        "--fail-fast",
+        help="Run cheap criteria first and stop once the passing score is out of reach",
+    ),
 ):
     """Validate a PDF resume against quality criteria."""
 
@@ -77,6 +79,10 @@ def check(
                 f"[yellow]Warning: Custom words file not found: {custom_words_path}[/yellow]"
             )
 
+    # Imported here so that help and argument errors don't load the PDF stack
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from .main import create_criteria_list, run_validation, ValidationConfig
+
     # Create validation configuration
     config = ValidationConfig(
         pdf_path=pdf_path,
@@ -106,9 +112,7 @@ def check(
         all_criteria = filtered_criteria
 
     # Run validation
-    results = []
     total_weight = sum(c.weight for c in all_criteria)
-    passed_weight = 0
 
     with Progress(
         SpinnerColumn(),
@@ -117,35 +121,19 @@ def check(
     ) as progress:
         task = progress.add_task("Running validation...", total=len(all_criteria))
 
-        for criterion in all_criteria:
-            progress.update(task, description=f"Checking: {criterion.name}")
-
-            try:
-                passed = criterion.check_func()
-                if passed:
-                    passed_weight += criterion.weight
-                results.append(
-                    {
-                        "name": criterion.name,
-                        "description": criterion.description,
-                        "weight": criterion.weight,
-                        "passed": passed,
-                        "error": None,
-                    }
-                )
-            except Exception as e:
-                results.append(
-                    {
-                        "name": criterion.name,
-                        "description": criterion.description,
-                        "weight": criterion.weight,
-                        "passed": False,
-                        "error": str(e),
-                    }
-                )
-
+        def on_result(result: dict) -> None:
+            progress.update(task, description=f"Checked: {result['name']}")
             progress.advance(task)
 
+        results = run_validation(
+            config,
+            all_criteria,
+            on_result=on_result,
+            fail_below=passing_score if fail_fast else None,
+        )
+
+    passed_weight = sum(r["weight"] for r in results if r["passed"])
+
     # Calculate score
     score = (passed_weight / total_weight) * 100 if total_weight > 0 else 0
     passed_count = sum(1 for r in results if r["passed"])
@@ -233,19 +221,20 @@ def check(
 @app.command()
 def list_criteria():
     """List all available validation criteria."""
-    # Create a dummy config for listing criteria
-    dummy_config = ValidationConfig(pdf_path=Path("dummy.pdf"))
-    criteria = create_criteria_list(dummy_config)
+    from .main import describe_criteria
+
+    # Listing only needs the static metadata, described with default settings
+    criteria = describe_criteria()
 
     table = Table(title="Available Validation Criteria")
     table.add_column("Name", style="cyan", no_wrap=True)
     table.add_column("Weight", justify="right")
     table.add_column("Description", style="dim")
 
-    total_weight = sum(c.weight for c in criteria)
+    total_weight = sum(weight for _, _, weight in criteria)
 
-    for criterion in criteria:
-        table.add_row(criterion.name, f"{criterion.weight:.1f}", criterion.description)
+    for name, description, weight in criteria:
+        table.add_row(name, f"{weight:.1f}", description)
 
     console.print(table)
     console.print(f"\n[bold]Total Weight: {total_weight:.1f} points[/bold]")
@@ -254,6 +243,8 @@ def list_criteria():
 @app.command()
 def config():
     """Show current configuration values."""
+    from .main import ValidationConfig
+
     # Create a default config to show default values
     default_config = ValidationConfig(pdf_path=Path("example.pdf"))
 
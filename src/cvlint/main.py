@@ -1,22 +1,32 @@
-from dataclasses import dataclass
-from typing import Callable, List, Optional
-from pypdf import PdfReader
-from spellchecker import SpellChecker
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Union
 from pathlib import Path
+from types import MappingProxyType
+from collections import OrderedDict
 import re
-import fitz
-from PIL import Image
-import colorsys
-from pdfminer.high_level import extract_pages
-from pdfminer.layout import LTTextBox, LTTextLine, LTChar
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# The PDF, imaging and spelling libraries are slow to import, so they are
+# loaded inside the functions that need them. This keeps `cvlint --help`,
+# `list-criteria` and `config` fast.
+if TYPE_CHECKING:
+    import fitz
+    import numpy as np
+    from spellchecker import SpellChecker
 
 
 @dataclass
 class Criterion:
     name: str
     description: str
-    check_func: Callable[..., bool]  # receives parameters, returns True/False
+    check_func: Callable[["ParsedPdf"], bool]  # receives the parsed PDF
     weight: float  # how many points this criterion is worth
+    cost: int = 1  # rough run time: 1 file/metadata, 2 text, 3 rendering
+    thread_safe: bool = True  # False runs it alone, after the parallel ones
 
 
 @dataclass
@@ -38,337 +48,671 @@ class ValidationConfig:
 
 
 # ---------- Criteria List ----------
-def create_criteria_list(config: ValidationConfig) -> List[Criterion]:
-    """Create a list of all CV validation criteria."""
+@dataclass(frozen=True)
+class _RegisteredCheck:
+    name: str
+    description: str  # may refer to ValidationConfig fields, e.g. {max_pages}
+    weight: float
+    cost: int
+    check: Callable[..., bool]
+    options: Tuple[Tuple[str, str], ...]  # (check argument, config field) pairs
+
+
+# Every criterion, in report order (the order the checks are defined below)
+_REGISTRY: List[_RegisteredCheck] = []
+
+
+def register_check(
+    name: str, description: str, weight: float, cost: int = 1, **options: str
+) -> Callable[[Callable[..., bool]], Callable[..., bool]]:
+    """Register the decorated check function as a criterion.
+
+    `options` map the check's keyword arguments to the ValidationConfig
+    fields they are read from, e.g. max_pages="max_pages".
+    """
+
+    def decorator(check: Callable[..., bool]) -> Callable[..., bool]:
+        _REGISTRY.append(
+            _RegisteredCheck(
+                name, description, weight, cost, check, tuple(options.items())
+            )
+        )
+        return check
+
+    return decorator
+
+
+def describe_criteria(
+    config: Optional[ValidationConfig] = None,
+) -> List[Tuple[str, str, float]]:
+    """Name, description and weight of every criterion, without binding checks.
+
+    Descriptions are filled in from `config`, or from the ValidationConfig
+    defaults when no config is given.
+    """
+    if config is None:
+        values = {f.name: f.default for f in fields(ValidationConfig)}
+    else:
+        values = vars(config)
     return [
-        Criterion(
-            name="PDF File Exists",
-            description="Validates that the CV PDF file exists at the specified path",
-            check_func=lambda: check_pdf_exists(config.pdf_path),
-            weight=10.0,
-        ),
-        Criterion(
-            name="Single Page Limit",
-            description="Ensures the CV is exactly one page or less",
-            check_func=lambda: check_pdf_page_count(config.pdf_path, config.max_pages),
-            weight=15.0,
-        ),
-        Criterion(
-            name="File Size Constraint",
-            description=f"Validates that the PDF file size is within {config.max_file_size_kb}KB limit",
-            check_func=lambda: check_pdf_file_size(
-                config.pdf_path, config.max_file_size_kb
-            ),
-            weight=8.0,
-        ),
-        Criterion(
-            name="Font Size Range",
-            description=f"Ensures all fonts are between {config.min_font}pt and {config.max_font}pt",
-            check_func=lambda: check_pdf_font_sizes(
-                config.pdf_path, config.min_font, config.max_font
-            ),
-            weight=12.0,
-        ),
-        Criterion(
-            name="HTTPS Links Only",
-            description="Validates that all links in the PDF use HTTPS protocol",
-            check_func=lambda: check_pdf_links_https(
-                config.pdf_path, config.enforce_https
-            ),
-            weight=7.0,
-        ),
-        Criterion(
-            name="No Embedded Images",
-            description="Ensures the PDF contains no embedded images",
-            check_func=lambda: check_pdf_no_images(config.pdf_path, config.no_images),
-            weight=5.0,
-        ),
-        Criterion(
-            name="White Background",
-            description="Validates that the PDF has a white background",
-            check_func=lambda: check_pdf_background_white(
-                config.pdf_path, config.background_white
-            ),
-            weight=6.0,
-        ),
-        Criterion(
-            name="Grayscale Colors Only",
-            description="Ensures all colors in the PDF are grayscale (no saturation)",
-            check_func=lambda: check_pdf_all_pixels_no_saturation(
-                config.pdf_path, config.grayscale_colors
-            ),
-            weight=8.0,
-        ),
-        Criterion(
-            name="Spell Check and Capitalization",
-            description="Validates spelling and proper capitalization of technical terms",
-            check_func=lambda: check_pdf_spell_check(
-                config.pdf_path, config.custom_words
-            ),
-            weight=20.0,
-        ),
-        Criterion(
-            name="PDF Structure and Metadata",
-            description="Validates PDF metadata (author, title) and text readability",
-            check_func=lambda: check_pdf_structure(config.pdf_path),
-            weight=9.0,
-        ),
-        Criterion(
-            name="PDF Integrity",
-            description="Ensures the PDF is not corrupted and can be properly read",
-            check_func=lambda: check_pdf_not_corrupted(config.pdf_path),
-            weight=10.0,
-        ),
+        (entry.name, entry.description.format_map(values), entry.weight)
+        for entry in _REGISTRY
     ]
 
 
+def create_criteria_list(config: ValidationConfig) -> List[Criterion]:
+    """Create a list of all CV validation criteria."""
+    criteria = []
+    for entry, (name, description, weight) in zip(_REGISTRY, describe_criteria(config)):
+        check_func = entry.check
+        if entry.options:
+            check_func = functools.partial(
+                check_func,
+                **{arg: getattr(config, field) for arg, field in entry.options},
+            )
+        criteria.append(
+            Criterion(
+                name=name,
+                description=description,
+                check_func=check_func,
+                weight=weight,
+                cost=entry.cost,
+            )
+        )
+    return criteria
+
+
+# ---------- Parsed PDF ----------
+# Pixel-level criteria only need to spot color, not resolve fine detail, so
+# pages are rasterized at half of PyMuPDF's default 72 DPI.
+RENDER_SCALE = 0.5
+
+# Rows per band when scanning a render; a band of a typical page stays well
+# within L2 cache.
+SCAN_TILE_ROWS = 64
+
+# Content stream operators that may paint in color, or paint something whose
+# colors can't be read off the stream (images, shadings, forms, Type 3 glyphs,
+# graphics states). rg/RG are captured with their operands, as they set a gray
+# when all three components are equal. Tokens end at whitespace or delimiters.
+_TOKEN_START = rb"(?<![^\s()<>\[\]{}/%])"
+_TOKEN_END = rb"(?![^\s()<>\[\]{}/%])"
+_NUMBER = rb"([-+]?[\d.]+)\s+"
+_COLOR_OPERATOR_RE = re.compile(
+    rb"(?:"
+    + _TOKEN_START
+    + _NUMBER * 3
+    + rb")?"
+    + _TOKEN_START
+    + rb"(rg|RG|k|K|cs|CS|sc|SC|scn|SCN|sh|Do|BI|gs|d0|d1)"
+    + _TOKEN_END
+)
+
+
+def _paints_gray_only(page: fitz.Page) -> bool:
+    """Whether the page's own content provably paints in gray only.
+
+    Errs on the side of False: anything the content stream doesn't spell out
+    (images, annotations, unusual operators) means the page has to be
+    rendered to find out.
+    """
+    if page.first_annot is not None or page.first_widget is not None:
+        return False
+    if any(font[2] == "Type3" for font in page.get_fonts()):
+        return False
+
+    try:
+        for match in _COLOR_OPERATOR_RE.finditer(page.read_contents()):
+            red, green, blue, operator = match.groups()
+            if operator not in (b"rg", b"RG") or red is None:
+                return False
+            if not float(red) == float(green) == float(blue):
+                return False
+    except ValueError:  # a malformed number
+        return False
+    return True
+
+
+class _locked_cached_property(functools.cached_property):
+    """A cached_property that builds its value while holding the owner's lock."""
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        with instance.lock:
+            return super().__get__(instance, owner)
+
+
+@dataclass(eq=False)
+class ParsedPdf:
+    """A PDF opened once and shared by every criterion in a run.
+
+    Each view is built on first access, so criteria that are filtered out or
+    disabled never pay for parsing they don't need. Errors (missing or
+    corrupted files) surface when a view is accessed, inside the check that
+    asked for it.
+
+    Pages are rendered one at a time, on request, by `page_pixels`.
+
+    Criteria may run on several threads. Views are built under `lock`, and
+    code that works with `doc` directly must hold it as well, since PyMuPDF
+    objects are not thread-safe.
+
+    A PDF that is already in memory can be wrapped with `from_bytes`; its
+    `path` is then None.
+    """
+
+    path: Optional[Path]
+    lock: threading.RLock = field(default_factory=threading.RLock, repr=False)
+    _rendered: Dict[int, np.ndarray] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ParsedPdf":
+        parsed = cls(None)
+        parsed.__dict__["data"] = data  # fills the cached view, no file to read
+        return parsed
+
+    @_locked_cached_property
+    def data(self) -> bytes:
+        """The raw file, read once and handed to every parser from memory."""
+        return self.path.read_bytes()
+
+    @_locked_cached_property
+    def doc(self) -> fitz.Document:
+        import fitz
+
+        doc = fitz.open(stream=self.data, filetype="pdf")
+        # MuPDF sniffs the content and will happily open e.g. plain text as a
+        # paginated document, so make sure it really parsed a PDF
+        if not doc.is_pdf:
+            doc.close()
+            raise ValueError(f"{self.path or 'data'} is not a PDF file")
+        return doc
+
+    @_locked_cached_property
+    def pages_text(self) -> Tuple[str, ...]:
+        """Text of every page, extracted once for all text-based criteria."""
+        import fitz
+
+        # Expand ligatures, so words like "ﬁnance" come out as plain letters
+        flags = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_LIGATURES
+        return tuple(page.get_text(flags=flags) for page in self.doc)
+
+    @_locked_cached_property
+    def gray_pages(self) -> Tuple[bool, ...]:
+        """Per page, whether its content stream shows it is grayscale.
+
+        Reading the operators is far cheaper than rendering, so pixel checks
+        can skip the pages this vouches for.
+        """
+        return tuple(_paints_gray_only(page) for page in self.doc)
+
+    def page_pixels(self, index: int) -> np.ndarray:
+        """Page `index` rendered at RENDER_SCALE, as a (height, width, 3) RGB array.
+
+        Each page is rendered the first time it is asked for, so a check that
+        only looks at some pages doesn't pay for the others. The arrays are
+        read-only views of the rendered samples, so criteria can share them
+        across threads without copying.
+        """
+        import fitz
+        import numpy as np
+
+        with self.lock:
+            if index not in self._rendered:
+                # Always RGB, whatever the page's own colorspace, so the pixel
+                # checks can rely on three channels per pixel
+                pix = self.doc[index].get_pixmap(
+                    matrix=fitz.Matrix(RENDER_SCALE, RENDER_SCALE),
+                    colorspace=fitz.csRGB,
+                    alpha=False,
+                )
+                pixels = np.frombuffer(pix.samples, dtype=np.uint8)
+                self._rendered[index] = pixels.reshape(pix.height, pix.width, 3)
+            return self._rendered[index]
+
+    def close(self) -> None:
+        """Close the document. A view asked for afterwards opens it again."""
+        with self.lock:
+            doc = self.__dict__.pop("doc", None)
+            if doc is not None:
+                doc.close()
+
+    def __enter__(self) -> "ParsedPdf":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+PdfSource = Union[Path, bytes, ParsedPdf]
+
+
+# Parsed files shared by checks called with a bare path, least recently used
+# first. Evicted entries are closed, so their MuPDF documents don't stay open
+# until garbage collection; long-running callers that check many files can
+# also build and close their own ParsedPdf.
+PARSED_FILES_CACHE_SIZE = 8
+_parsed_files: "OrderedDict[Tuple[Path, int, int], ParsedPdf]" = OrderedDict()
+_parsed_files_lock = threading.Lock()
+
+
+def _parsed_file(path: Path, mtime_ns: int, size: int) -> ParsedPdf:
+    """A ParsedPdf per file version, shared by checks called with a bare path.
+
+    The modification time and size are part of the key, so a file that is
+    rewritten in place is parsed again.
+    """
+    key = (path, mtime_ns, size)
+    evicted = []
+    with _parsed_files_lock:
+        parsed = _parsed_files.get(key)
+        if parsed is None:
+            parsed = _parsed_files[key] = ParsedPdf(path)
+            while len(_parsed_files) > PARSED_FILES_CACHE_SIZE:
+                evicted.append(_parsed_files.popitem(last=False)[1])
+        else:
+            _parsed_files.move_to_end(key)
+
+    # Outside the cache lock, as closing waits for checks using the document
+    for old in evicted:
+        old.close()
+    return parsed
+
+
+def _clear_parsed_files() -> None:
+    """Close and forget every cached ParsedPdf."""
+    with _parsed_files_lock:
+        cached = list(_parsed_files.values())
+        _parsed_files.clear()
+    for parsed in cached:
+        parsed.close()
+
+
+def _parsed(pdf: PdfSource) -> ParsedPdf:
+    """Accept a path, the PDF's bytes or an already parsed PDF."""
+    if isinstance(pdf, ParsedPdf):
+        return pdf
+    if isinstance(pdf, bytes):
+        return ParsedPdf.from_bytes(pdf)
+
+    path = Path(pdf)
+    try:
+        stat = path.stat()
+    except OSError:
+        return ParsedPdf(path)  # the check reports the missing file
+    return _parsed_file(path, stat.st_mtime_ns, stat.st_size)
+
+
 # ---------- PDF Checks ----------
-def check_pdf_exists(pdf_path: Path) -> bool:
+# Words in their original case. Words shorter than three letters are skipped
+# as likely abbreviations.
+_WORD_RE = re.compile(r"\b[a-zA-Z]{3,}\b")
+
+# Technology names (e.g. NodeJS, MySQL) are accepted when they contain one of these
+_TECH_RE = re.compile(r"js|sql|xml|json")
+
+# Pieces of web and email addresses that end up as words in extracted text
+_URL_TERMS = frozenset({"https", "http", "www", "com", "org", "net"})
+_URL_PART_RE = re.compile(r"github|linkedin|gmail|yahoo|hotmail")
+
+# Like most readers, accept the header anywhere in the first kilobyte, and
+# take the last end-of-file marker wherever it is, since some writers pad
+# around them
+_PDF_HEADER = b"%PDF-"
+_PDF_HEADER_BYTES = 1024
+_PDF_EOF = b"%%EOF"
+
+# Every complete PDF ends with a trailer that points at its cross-reference
+# data. Readers repair a pointer that is off, so only its presence is checked.
+_PDF_STARTXREF = b"startxref"
+
+
+@register_check(
+    "PDF File Exists",
+    "Validates that the CV PDF file exists at the specified path",
+    weight=10.0,
+)
+def check_pdf_exists(pdf: PdfSource) -> bool:
     """Check that the CV PDF file exists at the specified path."""
-    return pdf_path.is_file()
+    path = _parsed(pdf).path
+    return path is None or path.is_file()  # a PDF given as bytes is present
 
 
-def check_pdf_page_count(pdf_path: Path, max_pages: int) -> bool:
+@register_check(
+    "Single Page Limit",
+    "Ensures the CV is exactly one page or less",
+    weight=15.0,
+    max_pages="max_pages",
+)
+def check_pdf_page_count(pdf: PdfSource, max_pages: int) -> bool:
     """Check that the CV is exactly one page or less."""
+    parsed = _parsed(pdf)
     try:
-        pdf = PdfReader(pdf_path)
-        return len(pdf.pages) <= max_pages
+        with parsed.lock:
+            return parsed.doc.page_count <= max_pages
     except Exception:
         return False
 
 
-def check_pdf_file_size(pdf_path: Path, max_file_size_kb: float) -> bool:
+@register_check(
+    "File Size Constraint",
+    "Validates that the PDF file size is within {max_file_size_kb}KB limit",
+    weight=8.0,
+    max_file_size_kb="max_file_size_kb",
+)
+def check_pdf_file_size(pdf: PdfSource, max_file_size_kb: float) -> bool:
     """Check that the PDF file size is within the specified limit."""
+    parsed = _parsed(pdf)
     try:
-        file_size_kb = pdf_path.stat().st_size / 1024
+        # A single stat() call; the file doesn't need to be read for this
+        if parsed.path is None:
+            file_size = len(parsed.data)
+        else:
+            file_size = parsed.path.stat().st_size
+        file_size_kb = file_size / 1024
         return file_size_kb <= max_file_size_kb
     except Exception:
         return False
 
 
-def check_pdf_font_sizes(pdf_path: Path, min_size: int, max_size: int) -> bool:
+@register_check(
+    "Font Size Range",
+    "Ensures all fonts are between {min_font}pt and {max_font}pt",
+    weight=12.0,
+    cost=2,
+    min_size="min_font",
+    max_size="max_font",
+)
+def check_pdf_font_sizes(pdf: PdfSource, min_size: int, max_size: int) -> bool:
     """Test that all fonts in the PDF are within the specified size range."""
+    import fitz
+    import numpy as np
+
+    parsed = _parsed(pdf)
     try:
-        for page_layout in extract_pages(pdf_path):
-            for element in page_layout:
-                if isinstance(element, (LTTextBox, LTTextLine)):
-                    for text_line in element:
-                        for char in text_line:
-                            if isinstance(char, LTChar):
-                                font_size = char.size
-                                if font_size < min_size or font_size > max_size:
-                                    return False
+        with parsed.lock:
+            for page in parsed.doc:
+                # Text spans carry their font size; no layout analysis is needed
+                text = page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT)
+                sizes = np.fromiter(
+                    (
+                        span["size"]
+                        for block in text["blocks"]
+                        if block["type"] == 0
+                        for line in block["lines"]
+                        for span in line["spans"]
+                    ),
+                    dtype=np.float64,
+                )
+                # Two reductions instead of two full-size comparison masks
+                if sizes.size and (sizes.min() < min_size or sizes.max() > max_size):
+                    return False
         return True
     except Exception:
         return False
 
 
-def check_pdf_links_https(pdf_path: Path, enforce_https: bool) -> bool:
+@register_check(
+    "HTTPS Links Only",
+    "Validates that all links in the PDF use HTTPS protocol",
+    weight=7.0,
+    enforce_https="enforce_https",
+)
+def check_pdf_links_https(pdf: PdfSource, enforce_https: bool) -> bool:
     """Check that all links in the PDF use HTTPS when enforce_https is True."""
     if not enforce_https:
         return True  # Skip check if HTTPS enforcement is disabled
 
+    parsed = _parsed(pdf)
     try:
-        pdf = PdfReader(pdf_path)
-        links = []
-
-        for page in pdf.pages:
-            if "/Annots" in page:
-                annotations = page["/Annots"]
-                for annotation in annotations:
-                    annotation_obj = annotation.get_object()
-                    if "/A" in annotation_obj and "/URI" in annotation_obj["/A"]:
-                        uri = annotation_obj["/A"]["/URI"]
-                        links.append(uri)
-
-        for link in links:
-            if not link.startswith("https://"):
-                return False
-
-        return True
+        # PyMuPDF resolves link annotations in C; only URI links carry a "uri"
+        # Stops at the first page with an offending link
+        with parsed.lock:
+            return all(
+                link["uri"].startswith("https://")
+                for page in parsed.doc
+                for link in page.get_links()
+                if link.get("uri")
+            )
     except Exception:
         return False
 
 
-def check_pdf_no_images(pdf_path: Path, no_images: bool) -> bool:
+@register_check(
+    "No Embedded Images",
+    "Ensures the PDF contains no embedded images",
+    weight=5.0,
+    no_images="no_images",
+)
+def check_pdf_no_images(pdf: PdfSource, no_images: bool) -> bool:
     """Check that the PDF contains no images when no_images is True."""
     if not no_images:
         return True  # Skip check if image checking is disabled
 
+    parsed = _parsed(pdf)
     try:
-        pdf = PdfReader(pdf_path)
-
-        for page_num, page in enumerate(pdf.pages):
-            if "/XObject" in page.get("/Resources", {}):
-                xobjects = page["/Resources"]["/XObject"]
-                for obj_name in xobjects:
-                    obj = xobjects[obj_name]
-                    if obj.get("/Subtype") == "/Image":
-                        return False
+        # PyMuPDF lists each page's image XObjects, including those used by
+        # form XObjects on the page, from its resources in one call
+        with parsed.lock:
+            for page_num in range(parsed.doc.page_count):
+                if parsed.doc.get_page_images(page_num):
+                    return False
 
         return True
     except Exception:
         return False
 
 
-def check_pdf_background_white(pdf_path: Path, background_white: bool) -> bool:
+@register_check(
+    "White Background",
+    "Validates that the PDF has a white background",
+    weight=6.0,
+    cost=3,
+    background_white="background_white",
+)
+def check_pdf_background_white(pdf: PdfSource, background_white: bool) -> bool:
     """Check that the PDF has a white background when background_white is True."""
     if not background_white:
         return True  # Skip check if background color checking is disabled
 
     try:
-        doc = fitz.open(pdf_path)
-        page = doc[0]
-        pix = page.get_pixmap(alpha=False)
+        pixels = _parsed(pdf).page_pixels(0)
 
-        r, g, b = pix.pixel(0, 0)
-        doc.close()
-
-        return (r, g, b) == (255, 255, 255)
+        # Content sits inside the margins, so the page border is background
+        border = (pixels[0], pixels[-1], pixels[:, 0], pixels[:, -1])
+        return all(bool((edge == 255).all()) for edge in border)
     except Exception:
         return False
 
 
-def rgb_to_hsv(rgb):
-    r, g, b = [x / 255.0 for x in rgb]
-    h, s, v = colorsys.rgb_to_hsv(r, g, b)
-    return h, s, v
+@functools.lru_cache(maxsize=8)
+def _saturation_limits(tolerance: float) -> np.ndarray:
+    """Largest allowed channel spread (max - min) for each channel maximum.
+
+    HSV saturation is (max - min) / max. The spread is a whole number, so it
+    exceeds tolerance * max exactly when it exceeds the floor of that, which
+    fits in a single byte. The table is built once per tolerance and is
+    read-only, since it is shared between runs.
+    """
+    import numpy as np
 
+    limits = np.floor(tolerance * np.arange(256)).clip(0, 255).astype(np.uint8)
+    limits.flags.writeable = False
+    return limits
 
+
+@register_check(
+    "Grayscale Colors Only",
+    "Ensures all colors in the PDF are grayscale (no saturation)",
+    weight=8.0,
+    cost=3,
+    grayscale_colors="grayscale_colors",
+)
 def check_pdf_all_pixels_no_saturation(
-    pdf_path: Path, grayscale_colors: bool, tolerance: float = 0.01
+    pdf: PdfSource, grayscale_colors: bool, tolerance: float = 0.01
 ) -> bool:
     """Check that every pixel in the PDF has saturation <= tolerance (i.e., grayscale)."""
     if not grayscale_colors:
         return True  # Skip check if grayscale color checking is disabled
 
-    try:
-        doc = fitz.open(pdf_path)
-
-        for page_num, page in enumerate(doc, start=1):
-            pix = page.get_pixmap(alpha=False)
-            image = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-            pixels = image.getdata()
+    import numpy as np
 
-            for i, pixel in enumerate(pixels):
-                _, s, _ = rgb_to_hsv(pixel)
-                if s > tolerance:
-                    doc.close()
+    try:
+        parsed = _parsed(pdf)
+        limits = _saturation_limits(tolerance)
+
+        for index, gray in enumerate(parsed.gray_pages):
+            if gray:
+                continue  # provably gray, no need to render it
+            pixels = parsed.page_pixels(index)
+            height, width, _ = pixels.shape
+
+            # Work buffers for one band, reused so the scan allocates per page only
+            band = (min(SCAN_TILE_ROWS, height), width)
+            max_buf = np.empty(band, dtype=np.uint8)
+            spread_buf = np.empty(band, dtype=np.uint8)
+            limit_buf = np.empty(band, dtype=np.uint8)
+            bad_buf = np.empty(band, dtype=bool)
+
+            # Scan bands of rows so a colored page stops at the first hit
+            for top in range(0, height, SCAN_TILE_ROWS):
+                tile = pixels[top : top + SCAN_TILE_ROWS]
+                rows = len(tile)
+                red, green, blue = tile[..., 0], tile[..., 1], tile[..., 2]
+
+                # Elementwise max/min across the channel planes run as SIMD
+                # loops; reducing over the length-3 channel axis does not
+                max_c = np.maximum(red, green, out=max_buf[:rows])
+                np.maximum(max_c, blue, out=max_c)
+                spread = np.minimum(red, green, out=spread_buf[:rows])
+                np.minimum(spread, blue, out=spread)
+                np.subtract(max_c, spread, out=spread)  # never negative
+                limit = np.take(limits, max_c, out=limit_buf[:rows])
+                if np.greater(spread, limit, out=bad_buf[:rows]).any():
                     return False
 
-        doc.close()
         return True
     except Exception:
         return False
 
 
-def check_pdf_spell_check(pdf_path: Path, custom_words: List[str]) -> bool:
+@functools.lru_cache(maxsize=1)
+def _base_spellchecker() -> SpellChecker:
+    """Load the English dictionary once per process.
+
+    Custom words are checked separately, so this instance is never modified.
+    """
+    from spellchecker import SpellChecker
+
+    return SpellChecker()
+
+
+@functools.lru_cache(maxsize=8)
+def _custom_word_sets(
+    custom_words: Tuple[str, ...],
+) -> Tuple[frozenset, MappingProxyType]:
+    """Split custom words into the lowercase set and the required spellings.
+
+    Custom words are matched case-insensitively against the text. Those with
+    specific capitalization (anything not all lowercase) must appear exactly
+    as defined; all lowercase ones may also be capitalized. Returns every
+    custom word lowercased, and a read-only map from lowercase to required
+    spelling for the capitalized ones.
+    """
+    custom_lower = frozenset(word.lower() for word in custom_words)
+    required_casing = {
+        word.lower(): word for word in custom_words if not word.islower()
+    }
+    return custom_lower, MappingProxyType(required_casing)
+
+
+@register_check(
+    "Spell Check and Capitalization",
+    "Validates spelling and proper capitalization of technical terms",
+    weight=20.0,
+    cost=2,
+    custom_words="custom_words",
+)
+def check_pdf_spell_check(pdf: PdfSource, custom_words: List[str]) -> bool:
     """Check that the PDF text passes spell checking with custom words and capitalization rules."""
     try:
-        pdf = PdfReader(pdf_path)
-        spell = SpellChecker()
-
-        # Build allowed word variations based on capitalization rules
-        allowed_words = set()
-        capitalization_errors = []
-
-        for custom_word in custom_words:
-            if custom_word.islower():
-                # All lowercase words allow both lowercase and first-letter capitalization
-                allowed_words.add(custom_word)
-                allowed_words.add(custom_word.capitalize())
-            else:
-                # Words with specific capitalization must appear exactly as defined
-                allowed_words.add(custom_word)
-
-        # Also add standard dictionary words
-        spell.word_frequency.load_words(allowed_words)
-
-        # Extract all text from the PDF
-        full_text = ""
-        for page in pdf.pages:
-            full_text += page.extract_text()
-
-        # Extract words preserving original case
-        original_words = re.findall(r"\b[a-zA-Z]+\b", full_text)
-
-        # Check each word for spelling and capitalization
-        actual_misspelled = []
-        for word in original_words:
-            # Skip very short words (likely abbreviations)
-            if len(word) < 3:
-                continue
-            # Skip single letters
-            if len(word) == 1:
-                continue
+        pages_text = _parsed(pdf).pages_text
+        dictionary = _base_spellchecker().word_frequency.dictionary
 
-            # Check for capitalization errors in custom words FIRST
-            found_capitalization_error = False
-            for custom_word in custom_words:
-                if word.lower() == custom_word.lower() and word != custom_word:
-                    # If custom word is not all lowercase, it has specific capitalization requirements
-                    if not custom_word.islower():
-                        capitalization_errors.append(
-                            f"Found '{word}' but should be '{custom_word}'"
-                        )
-                        found_capitalization_error = True
-                        break
-
-            # If we found a capitalization error, this word is an error - don't process further
-            if found_capitalization_error:
-                continue
+        custom_lower, required_casing = _custom_word_sets(tuple(custom_words))
 
-            # Check if word is in our allowed set or standard dictionary
-            if word in allowed_words or spell.known([word]):
+        # Collect distinct words page by page, so words at page boundaries
+        # don't run together, then lowercase each once (spelling ignores case)
+        words = set()
+        for text in pages_text:
+            words.update(_WORD_RE.findall(text))
+        lowered = {word: word.lower() for word in words}
+
+        # Check for capitalization errors in custom words FIRST
+        capitalization_errors = [
+            f"Found '{word}' but should be '{required_casing[word_lower]}'"
+            for word, word_lower in lowered.items()
+            if word_lower in required_casing and word != required_casing[word_lower]
+        ]
+
+        # Look up every distinct word in the dictionary in one batch. Custom
+        # words (including miscapitalized ones, reported above) count as known.
+        known = (dictionary.keys() & set(lowered.values())) | custom_lower
+
+        actual_misspelled = []
+        for word, word_lower in lowered.items():
+            if word_lower in known:
                 continue
 
             # Additional filtering for likely valid words (only for non-capitalization errors)
-            if word.lower().startswith(".") or word.lower().endswith("."):
+            if word_lower.startswith(".") or word_lower.endswith("."):
                 continue
-            if any(tech in word.lower() for tech in ["js", "sql", "xml", "json"]):
+            if _TECH_RE.search(word_lower):
                 continue
             # Skip common URL terms
-            if word.lower() in ["https", "http", "www", "com", "org", "net"]:
+            if word_lower in _URL_TERMS:
                 continue
             # Skip words that are part of URLs or email addresses
-            if any(
-                url_part in word.lower()
-                for url_part in ["github", "linkedin", "gmail", "yahoo", "hotmail"]
-            ):
+            if _URL_PART_RE.search(word_lower):
                 continue
 
             actual_misspelled.append(word)
 
-        # Remove duplicates while preserving order
-        actual_misspelled = list(dict.fromkeys(actual_misspelled))
-
         # Return False if there are any spelling or capitalization errors
         return len(actual_misspelled) == 0 and len(capitalization_errors) == 0
     except Exception:
         return False
 
 
-def check_pdf_structure(pdf_path: Path) -> bool:
+@register_check(
+    "PDF Structure and Metadata",
+    "Validates PDF metadata (author, title) and text readability",
+    weight=9.0,
+    cost=2,
+)
+def check_pdf_structure(pdf: PdfSource) -> bool:
     """Check basic PDF structure and readability."""
+    parsed = _parsed(pdf)
     try:
-        pdf = PdfReader(pdf_path)
-
-        # Test that PDF has metadata
-        metadata = pdf.metadata
-        if metadata is None:
-            return False
+        with parsed.lock:
+            # Test that PDF has metadata
+            metadata = parsed.doc.metadata
+            if metadata is None:
+                return False
 
-        author = metadata.get("/Author")
-        if author is None or author.strip() == "":
-            return False
+            author = metadata.get("author")
+            if author is None or author.strip() == "":
+                return False
 
-        title = metadata.get("/Title")
-        if title is None or title.strip() == "":
-            return False
+            title = metadata.get("title")
+            if title is None or title.strip() == "":
+                return False
 
         # Test that we can extract text from all pages
-        for page_num, page in enumerate(pdf.pages):
-            text = page.extract_text()
+        for text in parsed.pages_text:
             if len(text.strip()) == 0:
                 return False
 
@@ -377,13 +721,159 @@ def check_pdf_structure(pdf_path: Path) -> bool:
         return False
 
 
-def check_pdf_not_corrupted(pdf_path: Path) -> bool:
+@register_check(
+    "PDF Integrity",
+    "Ensures the PDF is not corrupted and can be properly read",
+    weight=10.0,
+    cost=2,
+)
+def check_pdf_not_corrupted(pdf: PdfSource) -> bool:
     """Check that the PDF is not corrupted and can be properly read."""
     try:
-        pdf = PdfReader(pdf_path)
-        # Try to access all pages
-        for page in pdf.pages:
-            page.extract_text()
+        parsed = _parsed(pdf)
+
+        # Truncated and non-PDF files are caught from the raw bytes alone,
+        # without handing them to the parser
+        data = parsed.data
+        header = data.find(_PDF_HEADER, 0, _PDF_HEADER_BYTES)
+        eof = data.rfind(_PDF_EOF)
+        if header < 0 or eof < 0:
+            return False
+        if data.rfind(_PDF_STARTXREF, header, eof) < 0:
+            return False
+
+        # Text extraction touches every page's content
+        parsed.pages_text
         return True
     except Exception:
         return False
+
+
+# ---------- Validation ----------
+# Checks mostly wait on ParsedPdf.lock or hold the GIL, so a few threads are
+# enough to overlap the parts that don't (rendering, file reads).
+MAX_WORKERS = 4
+
+
+def _run_criterion(criterion: Criterion, pdf: ParsedPdf) -> dict:
+    """Run a single criterion against the parsed PDF and describe the outcome."""
+    try:
+        passed = criterion.check_func(pdf)
+        error = None
+    except Exception as e:
+        passed = False
+        error = str(e)
+
+    return {
+        "name": criterion.name,
+        "description": criterion.description,
+        "weight": criterion.weight,
+        "passed": passed,
+        "error": error,
+    }
+
+
+def _skipped(
+    criterion: Criterion,
+    reason: str = "Skipped: the passing score could no longer be reached",
+) -> dict:
+    """Result for a criterion that was not run because the outcome was decided."""
+    return {
+        "name": criterion.name,
+        "description": criterion.description,
+        "weight": criterion.weight,
+        "passed": False,
+        "error": reason,
+    }
+
+
+def _run_until_unreachable(
+    criteria: List[Criterion],
+    pdf: ParsedPdf,
+    passing_score: float,
+    on_result: Optional[Callable[[dict], None]],
+) -> List[dict]:
+    """Run the cheapest criteria first, stopping once passing_score is out of reach."""
+    total_weight = sum(c.weight for c in criteria)
+    remaining_weight = total_weight
+    passed_weight = 0.0
+    results = [None] * len(criteria)
+
+    for index in sorted(range(len(criteria)), key=lambda i: criteria[i].cost):
+        criterion = criteria[index]
+        best_score = (passed_weight + remaining_weight) / (total_weight or 1) * 100
+        if best_score < passing_score:
+            result = _skipped(criterion)
+        else:
+            result = _run_criterion(criterion, pdf)
+            remaining_weight -= criterion.weight
+            if result["passed"]:
+                passed_weight += criterion.weight
+
+        results[index] = result
+        if on_result is not None:
+            on_result(result)
+
+    return results
+
+
+def run_validation(
+    config: ValidationConfig,
+    criteria: Optional[List[Criterion]] = None,
+    on_result: Optional[Callable[[dict], None]] = None,
+    fail_below: Optional[float] = None,
+) -> List[dict]:
+    """Run criteria against config.pdf_path, parsing the PDF only once.
+
+    Runs every criterion from `config` unless `criteria` is given. Criteria
+    run in parallel over a shared ParsedPdf, except those that aren't
+    thread_safe, which run alone afterwards. `on_result` is called with each
+    result as soon as it is ready. Results are returned in criteria order.
+
+    With `fail_below` (a passing score, 0-100), criteria instead run one at a
+    time from cheapest to most expensive. Once the score can no longer reach
+    `fail_below`, the rest are skipped and reported as failed.
+
+    If the PDF file doesn't exist, no check runs and every criterion fails.
+    """
+    if criteria is None:
+        criteria = create_criteria_list(config)
+
+    # Without a file every check can only fail, so don't run any of them
+    if not Path(config.pdf_path).is_file():
+        results = [
+            _skipped(criterion, f"PDF file not found: {config.pdf_path}")
+            for criterion in criteria
+        ]
+        if on_result is not None:
+            for result in results:
+                on_result(result)
+        return results
+
+    with ParsedPdf(config.pdf_path) as pdf:
+        if fail_below is not None and criteria:
+            return _run_until_unreachable(criteria, pdf, fail_below, on_result)
+
+        results = [None] * len(criteria)
+        parallel = [i for i, criterion in enumerate(criteria) if criterion.thread_safe]
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(MAX_WORKERS, len(parallel)))
+        ) as executor:
+            futures = {
+                executor.submit(_run_criterion, criteria[i], pdf): i for i in parallel
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+                if on_result is not None:
+                    on_result(future.result())
+
+        # Criteria that can't share the PDF with other threads run one by one
+        for index, criterion in enumerate(criteria):
+            if not criterion.thread_safe:
+                results[index] = _run_criterion(criterion, pdf)
+                if on_result is not None:
+                    on_result(results[index])
+
+        # Results are in criteria order, not completion order
+        return results
@@ -10,12 +10,11 @@ from tests.utils import (
     create_large_pdf,
     create_font_size_test_pdf,
     create_colored_pdf,
+    create_pdf_with_edge_band,
     create_pdf_with_spelling_errors,
     create_pdf_without_metadata,
-    create_temp_pdf_file,
-    cleanup_temp_file,
+    red,
 )
-from reportlab.lib.colors import red, blue, Color
 
 
 @pytest.fixture
@@ -25,8 +24,28 @@ def temp_pdf_dir():
         yield Path(temp_dir)
 
 
-@pytest.fixture
-def valid_pdf():
+@pytest.fixture(scope="session", autouse=True)
+def clear_parsed_pdf_cache():
+    """Drop the PDFs that checks called with a path have cached."""
+    from src.cvlint.main import _clear_parsed_files
+
+    yield
+    _clear_parsed_files()
+
+
+def _write_pdf(tmp_path_factory, name: str, pdf_bytes: bytes) -> str:
+    """Write a generated PDF into the session's temporary directory."""
+    path = tmp_path_factory.getbasetemp() / name
+    path.write_bytes(pdf_bytes)
+    return str(path)
+
+
+# The PDF fixtures below are built once per test session and must be treated
+# as read-only by tests.
+
+
+@pytest.fixture(scope="session")
+def valid_pdf(tmp_path_factory):
     """Create a valid PDF that should pass all checks."""
     pdf_bytes = create_basic_pdf(
         text="This is a valid CV with proper content.",
@@ -35,13 +54,11 @@ def valid_pdf():
         author="John Doe",
         title="John Doe CV",
     )
-    temp_file = create_temp_pdf_file(pdf_bytes)
-    yield temp_file
-    cleanup_temp_file(temp_file)
+    return _write_pdf(tmp_path_factory, "valid_pdf.pdf", pdf_bytes)
 
 
-@pytest.fixture
-def multi_page_pdf():
+@pytest.fixture(scope="session")
+def multi_page_pdf(tmp_path_factory):
     """Create a PDF with multiple pages."""
     pdf_bytes = create_basic_pdf(
         text="This CV has multiple pages",
@@ -49,48 +66,40 @@ def multi_page_pdf():
         author="Test Author",
         title="Multi-page CV",
     )
-    temp_file = create_temp_pdf_file(pdf_bytes)
-    yield temp_file
-    cleanup_temp_file(temp_file)
+    return _write_pdf(tmp_path_factory, "multi_page_pdf.pdf", pdf_bytes)
 
 
-@pytest.fixture
-def large_pdf():
+@pytest.fixture(scope="session")
+def large_pdf(tmp_path_factory):
     """Create a PDF that exceeds size limits."""
     pdf_bytes = create_large_pdf(target_size_kb=600)
-    temp_file = create_temp_pdf_file(pdf_bytes)
-    yield temp_file
-    cleanup_temp_file(temp_file)
+    return _write_pdf(tmp_path_factory, "large_pdf.pdf", pdf_bytes)
 
 
-@pytest.fixture
-def small_font_pdf():
+@pytest.fixture(scope="session")
+def small_font_pdf(tmp_path_factory):
     """Create a PDF with fonts that are too small."""
     pdf_bytes = create_font_size_test_pdf(
         small_font=6,  # Below MIN_FONT (8)
         large_font=12,  # Normal size
         include_normal=True,
     )
-    temp_file = create_temp_pdf_file(pdf_bytes)
-    yield temp_file
-    cleanup_temp_file(temp_file)
+    return _write_pdf(tmp_path_factory, "small_font_pdf.pdf", pdf_bytes)
 
 
-@pytest.fixture
-def large_font_pdf():
+@pytest.fixture(scope="session")
+def large_font_pdf(tmp_path_factory):
     """Create a PDF with fonts that are too large."""
     pdf_bytes = create_font_size_test_pdf(
         small_font=12,  # Normal size
         large_font=24,  # Above MAX_FONT (21)
         include_normal=True,
     )
-    temp_file = create_temp_pdf_file(pdf_bytes)
-    yield temp_file
-    cleanup_temp_file(temp_file)
+    return _write_pdf(tmp_path_factory, "large_font_pdf.pdf", pdf_bytes)
 
 
-@pytest.fixture
-def http_link_pdf():
+@pytest.fixture(scope="session")
+def http_link_pdf(tmp_path_factory):
     """Create a PDF with HTTP (non-HTTPS) links."""
     pdf_bytes = create_basic_pdf(
         text="CV with HTTP link",
@@ -98,13 +107,11 @@ def http_link_pdf():
         author="Test Author",
         title="HTTP Link CV",
     )
-    temp_file = create_temp_pdf_file(pdf_bytes)
-    yield temp_file
-    cleanup_temp_file(temp_file)
+    return _write_pdf(tmp_path_factory, "http_link_pdf.pdf", pdf_bytes)
 
 
-@pytest.fixture
-def https_link_pdf():
+@pytest.fixture(scope="session")
+def https_link_pdf(tmp_path_factory):
     """Create a PDF with HTTPS links."""
     pdf_bytes = create_basic_pdf(
         text="CV with HTTPS link",
@@ -112,24 +119,20 @@ def https_link_pdf():
         author="Test Author",
         title="HTTPS Link CV",
     )
-    temp_file = create_temp_pdf_file(pdf_bytes)
-    yield temp_file
-    cleanup_temp_file(temp_file)
+    return _write_pdf(tmp_path_factory, "https_link_pdf.pdf", pdf_bytes)
 
 
-@pytest.fixture
-def pdf_with_image():
+@pytest.fixture(scope="session")
+def pdf_with_image(tmp_path_factory):
     """Create a PDF with embedded images."""
     pdf_bytes = create_basic_pdf(
         text="CV with image", add_image=True, author="Test Author", title="Image CV"
     )
-    temp_file = create_temp_pdf_file(pdf_bytes)
-    yield temp_file
-    cleanup_temp_file(temp_file)
+    return _write_pdf(tmp_path_factory, "pdf_with_image.pdf", pdf_bytes)
 
 
-@pytest.fixture
-def colored_background_pdf():
+@pytest.fixture(scope="session")
+def colored_background_pdf(tmp_path_factory):
     """Create a PDF with non-white background."""
     pdf_bytes = create_basic_pdf(
         text="CV with colored background",
@@ -137,51 +140,46 @@ def colored_background_pdf():
         author="Test Author",
         title="Colored Background CV",
     )
-    temp_file = create_temp_pdf_file(pdf_bytes)
-    yield temp_file
-    cleanup_temp_file(temp_file)
+    return _write_pdf(tmp_path_factory, "colored_background_pdf.pdf", pdf_bytes)
 
 
-@pytest.fixture
-def saturated_colors_pdf():
+@pytest.fixture(scope="session")
+def edge_band_pdf(tmp_path_factory):
+    """Create a white PDF with a colored band along the bottom edge."""
+    pdf_bytes = create_pdf_with_edge_band()
+    return _write_pdf(tmp_path_factory, "edge_band_pdf.pdf", pdf_bytes)
+
+
+@pytest.fixture(scope="session")
+def saturated_colors_pdf(tmp_path_factory):
     """Create a PDF with saturated (non-grayscale) colors."""
     pdf_bytes = create_colored_pdf(use_saturated_colors=True)
-    temp_file = create_temp_pdf_file(pdf_bytes)
-    yield temp_file
-    cleanup_temp_file(temp_file)
+    return _write_pdf(tmp_path_factory, "saturated_colors_pdf.pdf", pdf_bytes)
 
 
-@pytest.fixture
-def grayscale_pdf():
+@pytest.fixture(scope="session")
+def grayscale_pdf(tmp_path_factory):
     """Create a PDF with only grayscale colors."""
     pdf_bytes = create_colored_pdf(use_saturated_colors=False)
-    temp_file = create_temp_pdf_file(pdf_bytes)
-    yield temp_file
-    cleanup_temp_file(temp_file)
+    return _write_pdf(tmp_path_factory, "grayscale_pdf.pdf", pdf_bytes)
 
 
-@pytest.fixture
-def spelling_errors_pdf():
+@pytest.fixture(scope="session")
+def spelling_errors_pdf(tmp_path_factory):
     """Create a PDF with spelling errors."""
     pdf_bytes = create_pdf_with_spelling_errors()
-    temp_file = create_temp_pdf_file(pdf_bytes)
-    yield temp_file
-    cleanup_temp_file(temp_file)
+    return _write_pdf(tmp_path_factory, "spelling_errors_pdf.pdf", pdf_bytes)
 
 
-@pytest.fixture
-def no_metadata_pdf():
+@pytest.fixture(scope="session")
+def no_metadata_pdf(tmp_path_factory):
     """Create a PDF without proper metadata."""
     pdf_bytes = create_pdf_without_metadata()
-    temp_file = create_temp_pdf_file(pdf_bytes)
-    yield temp_file
-    cleanup_temp_file(temp_file)
+    return _write_pdf(tmp_path_factory, "no_metadata_pdf.pdf", pdf_bytes)
 
 
-@pytest.fixture
-def corrupted_pdf():
+@pytest.fixture(scope="session")
+def corrupted_pdf(tmp_path_factory):
     """Create a corrupted PDF."""
     pdf_bytes = create_basic_pdf(corrupt=True)
-    temp_file = create_temp_pdf_file(pdf_bytes)
-    yield temp_file
-    cleanup_temp_file(temp_file)
+    return _write_pdf(tmp_path_factory, "corrupted_pdf.pdf", pdf_bytes)
@@ -2,6 +2,8 @@
 
 import pytest
 import json
+import subprocess
+import sys
 from typer.testing import CliRunner
 from pathlib import Path
 from src.cvlint.cli import app
@@ -9,6 +11,16 @@ from src.cvlint.cli import app
 runner = CliRunner()
 
 
+def _run_python(code: str) -> subprocess.CompletedProcess:
+    """Run code in a fresh interpreter from the repository root."""
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).parent.parent,
+    )
+
+
 class TestBasicCLI:
     """Basic CLI functionality tests."""
 
@@ -30,6 +42,19 @@ class TestBasicCLI:
         assert "Single Page Limit" in result.stdout
         assert "Total Weight:" in result.stdout
 
+    def test_list_criteria_matches_default_check_criteria(self):
+        """Test that the listed metadata matches the criteria a default check runs."""
+        from src.cvlint.main import (
+            ValidationConfig,
+            create_criteria_list,
+            describe_criteria,
+        )
+
+        criteria = create_criteria_list(ValidationConfig(pdf_path=Path("cv.pdf")))
+        assert describe_criteria() == [
+            (c.name, c.description, c.weight) for c in criteria
+        ]
+
     def test_config_command(self):
         """Test that config command works."""
         result = runner.invoke(app, ["config"])
@@ -49,6 +74,14 @@ class TestCheckCommand:
         assert result.exit_code == 1
         assert "Error: PDF file not found" in result.stdout
 
+    def test_check_fail_fast_keeps_outcome(self, multi_page_pdf):
+        """Test that --fail-fast stops early but still fails the check."""
+        result = runner.invoke(
+            app, ["check", str(multi_page_pdf), "--fail-fast", "--passing-score", "100"]
+        )
+        assert result.exit_code == 1
+        assert "FAILED" in result.stdout
+
     # FIXME: this test is fragile, JSON output should be fixed.
     def test_check_valid_pdf_json_output(self, valid_pdf):
         """Test check command with valid PDF and JSON output."""
@@ -75,6 +108,17 @@ class TestCheckCommand:
         assert "results" in output_data
         assert isinstance(output_data["results"], list)
 
+    def test_check_json_results_follow_criteria_order(self, valid_pdf):
+        """Test that results are reported in criteria order despite running in parallel."""
+        from src.cvlint.main import ValidationConfig, create_criteria_list
+
+        result = runner.invoke(app, ["check", str(valid_pdf), "--output", "json"])
+        json_text = result.stdout[result.stdout.index("{") :]
+        names = [r["name"] for r in json.loads(json_text)["results"]]
+
+        expected = create_criteria_list(ValidationConfig(pdf_path=Path(valid_pdf)))
+        assert names == [c.name for c in expected]
+
     def test_check_valid_pdf_summary_output(self, valid_pdf):
         """Test check command with valid PDF and summary output."""
         result = runner.invoke(app, ["check", str(valid_pdf), "--output", "summary"])
@@ -105,6 +149,54 @@ class TestCheckCommand:
         assert result.exit_code == 1
         assert "Passing score must be between 0 and 100" in result.stdout
 
+    def test_bad_arguments_fail_before_loading_pdf_libraries(self):
+        """Test that argument errors exit before the PDF stack is imported."""
+        code = (
+            "import sys\n"
+            "from typer.testing import CliRunner\n"
+            "from src.cvlint.cli import app\n"
+            "for args in (['check', 'missing.pdf'], ['check', 'x.pdf', '--passing-score', '150']):\n"
+            "    assert CliRunner().invoke(app, args).exit_code == 1\n"
+            "heavy = {'fitz', 'pymupdf', 'pypdf', 'pdfminer', 'spellchecker', 'numpy'}\n"
+            "print(sorted(heavy & set(sys.modules)))\n"
+        )
+        result = _run_python(code)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "[]"
+
+    def test_listing_commands_run_as_module_without_pdf_libraries(self):
+        """Test that list-criteria and config run via python -m without the PDF stack."""
+        code = (
+            "import runpy, sys\n"
+            "for command in ('list-criteria', 'config'):\n"
+            "    sys.argv = ['cvlint', command]\n"
+            "    try:\n"
+            "        runpy.run_module('src.cvlint', run_name='__main__')\n"
+            "    except SystemExit as e:\n"
+            "        assert not e.code, e.code\n"
+            "heavy = {'fitz', 'pymupdf', 'pypdf', 'spellchecker', 'numpy'}\n"
+            "print(sorted(heavy & set(sys.modules)))\n"
+        )
+        result = _run_python(code)
+        assert result.returncode == 0, result.stderr
+        assert "PDF File Exists" in result.stdout
+        assert result.stdout.strip().splitlines()[-1] == "[]"
+
+    def test_check_does_not_import_pytest(self, valid_pdf):
+        """Test that a full check run has no runtime dependency on pytest."""
+        code = (
+            "import sys\n"
+            "from typer.testing import CliRunner\n"
+            "from src.cvlint.cli import app\n"
+            f"result = CliRunner().invoke(app, ['check', {str(valid_pdf)!r}])\n"
+            "assert result.exit_code == 0, result.output\n"
+            "assert 'Passed: 11/11 criteria' in result.output, result.output\n"
+            "print('pytest' in sys.modules)\n"
+        )
+        result = _run_python(code)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip().splitlines()[-1] == "False"
+
     def test_check_with_cli_options(self, valid_pdf):
         """Test check command with various CLI options."""
         result = runner.invoke(
@@ -2,9 +2,13 @@
 
 import pytest
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from src.cvlint.main import (
+    Criterion,
+    ParsedPdf,
     ValidationConfig,
     create_criteria_list,
+    run_validation,
     check_pdf_exists,
     check_pdf_page_count,
     check_pdf_file_size,
@@ -19,6 +23,22 @@ from src.cvlint.main import (
 )
 
 
+@pytest.fixture
+def rendered_pages(monkeypatch):
+    """Record the number of every page PyMuPDF renders during the test."""
+    import fitz
+
+    rendered = []
+    get_pixmap = fitz.Page.get_pixmap
+
+    def recording_get_pixmap(page, *args, **kwargs):
+        rendered.append(page.number)
+        return get_pixmap(page, *args, **kwargs)
+
+    monkeypatch.setattr(fitz.Page, "get_pixmap", recording_get_pixmap)
+    return rendered
+
+
 class TestPdfExists:
     """Test PDF file existence validation."""
 
@@ -33,6 +53,39 @@ class TestPdfExists:
         assert result is False
 
 
+class TestParsedPdfCache:
+    """Test the parsed PDFs shared by checks called with a path."""
+
+    def test_checks_share_a_parse_until_the_file_changes(self, tmp_path, valid_pdf):
+        """Test that checks called with the same path reuse one parsed PDF."""
+        from src.cvlint.main import _parsed
+
+        path = tmp_path / "cv.pdf"
+        path.write_bytes(Path(valid_pdf).read_bytes())
+        first = _parsed(path)
+        assert _parsed(path) is first
+
+        path.write_bytes(Path(valid_pdf).read_bytes() + b"\n")
+        assert _parsed(path) is not first
+
+    def test_evicted_documents_are_closed(self, tmp_path, valid_pdf):
+        """Test that a parse pushed out of the cache closes its document."""
+        from src.cvlint.main import PARSED_FILES_CACHE_SIZE, _parsed
+
+        pdf_bytes = Path(valid_pdf).read_bytes()
+        paths = [tmp_path / f"cv{i}.pdf" for i in range(PARSED_FILES_CACHE_SIZE + 1)]
+        for path in paths:
+            path.write_bytes(pdf_bytes)
+
+        first = _parsed(paths[0])
+        doc = first.doc
+        for path in paths[1:]:
+            _parsed(path)
+
+        assert doc.is_closed
+        assert check_pdf_page_count(first, max_pages=1)  # reopened on demand
+
+
 class TestPdfPageCount:
     """Test PDF page count validation."""
 
@@ -119,11 +172,6 @@ class TestPdfLinksHttps:
         result = check_pdf_links_https(Path(http_link_pdf), enforce_https=True)
         assert result is False
 
-    def test_https_enforcement_disabled(self, http_link_pdf):
-        """Test that check is skipped when HTTPS enforcement is disabled."""
-        result = check_pdf_links_https(Path(http_link_pdf), enforce_https=False)
-        assert result is True  # Should return True when enforcement is disabled
-
     def test_no_links_pass(self, valid_pdf):
         """Test that PDFs without links pass."""
         result = check_pdf_links_https(Path(valid_pdf), enforce_https=True)
@@ -143,11 +191,6 @@ class TestPdfNoImages:
         result = check_pdf_no_images(Path(pdf_with_image), no_images=True)
         assert result is False
 
-    def test_image_checking_disabled(self, pdf_with_image):
-        """Test that check is skipped when image checking is disabled."""
-        result = check_pdf_no_images(Path(pdf_with_image), no_images=False)
-        assert result is True  # Should return True when checking is disabled
-
 
 class TestPdfBackgroundWhite:
     """Test PDF background color validation."""
@@ -164,12 +207,10 @@ class TestPdfBackgroundWhite:
         )
         assert result is False
 
-    def test_background_checking_disabled(self, colored_background_pdf):
-        """Test that check is skipped when background checking is disabled."""
-        result = check_pdf_background_white(
-            Path(colored_background_pdf), background_white=False
-        )
-        assert result is True  # Should return True when checking is disabled
+    def test_colored_page_edge_fails(self, edge_band_pdf):
+        """Test that color anywhere on the page border fails, not just the corner."""
+        result = check_pdf_background_white(Path(edge_band_pdf), background_white=True)
+        assert result is False
 
 
 class TestPdfGrayscaleColors:
@@ -189,13 +230,6 @@ class TestPdfGrayscaleColors:
         )
         assert result is False
 
-    def test_grayscale_checking_disabled(self, saturated_colors_pdf):
-        """Test that check is skipped when grayscale checking is disabled."""
-        result = check_pdf_all_pixels_no_saturation(
-            Path(saturated_colors_pdf), grayscale_colors=False
-        )
-        assert result is True  # Should return True when checking is disabled
-
     def test_custom_tolerance(self, saturated_colors_pdf):
         """Test custom saturation tolerance."""
         # Should still fail even with higher tolerance for very saturated colors
@@ -204,6 +238,35 @@ class TestPdfGrayscaleColors:
         )
         assert result is False
 
+    def test_gray_content_is_not_rendered(self, grayscale_pdf, rendered_pages):
+        """Test that pages whose content only sets grays pass without rendering."""
+        pdf = ParsedPdf(Path(grayscale_pdf))
+        assert pdf.gray_pages == (True,)
+        assert check_pdf_all_pixels_no_saturation(pdf, grayscale_colors=True)
+        assert rendered_pages == []
+
+    def test_only_colored_pages_are_rendered(self, rendered_pages):
+        """Test that a mostly gray PDF renders just the page that uses color."""
+        from tests.utils import create_pdf_with_colored_page
+
+        pdf = ParsedPdf.from_bytes(
+            create_pdf_with_colored_page(pages=5, colored_page=2)
+        )
+        assert pdf.gray_pages == (True, True, False, True, True)
+        assert check_pdf_all_pixels_no_saturation(pdf, grayscale_colors=True) is False
+        assert rendered_pages == [2]
+
+    def test_color_and_images_are_rendered(self, saturated_colors_pdf, pdf_with_image):
+        """Test that color operators and images send pages to the pixel scan."""
+        assert ParsedPdf(Path(saturated_colors_pdf)).gray_pages == (False,)
+        assert ParsedPdf(Path(pdf_with_image)).gray_pages == (False,)
+
+    def test_rendered_grayscale_pages_pass(self, grayscale_pdf):
+        """Test that the pixel scan itself accepts a grayscale page."""
+        pdf = ParsedPdf(Path(grayscale_pdf))
+        pdf.__dict__["gray_pages"] = (False,)  # force the page to be rendered
+        assert check_pdf_all_pixels_no_saturation(pdf, grayscale_colors=True)
+
 
 class TestPdfSpellCheck:
     """Test PDF spell checking validation."""
@@ -220,11 +283,7 @@ class TestPdfSpellCheck:
 
     def test_custom_words_allowed(self):
         """Test that custom words are allowed."""
-        from tests.utils import (
-            create_basic_pdf,
-            create_temp_pdf_file,
-            cleanup_temp_file,
-        )
+        from tests.utils import create_basic_pdf
 
         # Create PDF with technical terms
         pdf_bytes = create_basic_pdf(
@@ -232,23 +291,15 @@ class TestPdfSpellCheck:
             author="Test Author",
             title="Technical CV",
         )
-        temp_file = create_temp_pdf_file(pdf_bytes)
 
-        try:
-            result = check_pdf_spell_check(
-                Path(temp_file), custom_words=["javascript", "postgresql"]
-            )
-            assert result is True
-        finally:
-            cleanup_temp_file(temp_file)
+        result = check_pdf_spell_check(
+            pdf_bytes, custom_words=["javascript", "postgresql"]
+        )
+        assert result is True
 
     def test_capitalization_rules(self):
         """Test capitalization rules for custom words."""
-        from tests.utils import (
-            create_basic_pdf,
-            create_temp_pdf_file,
-            cleanup_temp_file,
-        )
+        from tests.utils import create_basic_pdf
 
         # Create PDF with incorrectly capitalized technical terms (using a made-up framework name)
         pdf_bytes = create_basic_pdf(
@@ -256,15 +307,11 @@ class TestPdfSpellCheck:
             author="Test Author",
             title="Capitalization Test CV",
         )
-        temp_file = create_temp_pdf_file(pdf_bytes)
 
-        try:
-            result = check_pdf_spell_check(
-                Path(temp_file), custom_words=["ReactJS"]
-            )  # Specific capitalization required
-            assert result is False  # Should fail due to capitalization errors
-        finally:
-            cleanup_temp_file(temp_file)
+        result = check_pdf_spell_check(
+            pdf_bytes, custom_words=["ReactJS"]
+        )  # Specific capitalization required
+        assert result is False  # Should fail due to capitalization errors
 
 
 class TestPdfStructure:
@@ -282,11 +329,7 @@ class TestPdfStructure:
 
     def test_empty_metadata_fails(self):
         """Test that empty metadata fails."""
-        from tests.utils import (
-            create_basic_pdf,
-            create_temp_pdf_file,
-            cleanup_temp_file,
-        )
+        from tests.utils import create_basic_pdf
 
         # Create PDF with empty metadata
         pdf_bytes = create_basic_pdf(
@@ -294,13 +337,9 @@ class TestPdfStructure:
             author="",  # Empty author
             title="",  # Empty title
         )
-        temp_file = create_temp_pdf_file(pdf_bytes)
 
-        try:
-            result = check_pdf_structure(Path(temp_file))
-            assert result is False
-        finally:
-            cleanup_temp_file(temp_file)
+        result = check_pdf_structure(pdf_bytes)
+        assert result is False
 
 
 class TestPdfNotCorrupted:
@@ -316,17 +355,79 @@ class TestPdfNotCorrupted:
         result = check_pdf_not_corrupted(Path(corrupted_pdf))
         assert result is False
 
+    def test_non_pdf_file_fails(self, tmp_path):
+        """Test that a readable file that isn't a PDF fails."""
+        text_file = tmp_path / "cv.pdf"
+        text_file.write_text("This is plain text, not a PDF.\n" * 20)
+        result = check_pdf_not_corrupted(text_file)
+        assert result is False
+
+    def test_missing_eof_marker_fails(self):
+        """Test that a PDF cut off before its end-of-file marker fails."""
+        from tests.utils import create_basic_pdf
+
+        pdf_bytes = create_basic_pdf()
+        truncated = pdf_bytes[: pdf_bytes.rindex(b"%%EOF")]
+        assert check_pdf_not_corrupted(truncated) is False
+
+    def test_padding_after_eof_marker_passes(self):
+        """Test that a PDF followed by a few kilobytes of padding passes."""
+        from tests.utils import create_basic_pdf
+
+        pdf_bytes = create_basic_pdf()
+        assert check_pdf_not_corrupted(pdf_bytes + b"\n" * 2048) is True
+        assert check_pdf_not_corrupted(pdf_bytes + b"junk" * 512) is True
+
+    @pytest.mark.parametrize("shift", [2, 3])
+    def test_slightly_wrong_xref_offset_passes(self, shift):
+        """Test that a trailer pointing a few bytes off, which readers repair, passes."""
+        from tests.utils import create_basic_pdf
+
+        pdf_bytes = create_basic_pdf()
+        head, _, tail = pdf_bytes.rpartition(b"startxref")
+        offset = tail.split()[0]
+        shifted = str(int(offset) + shift).encode()
+        misindexed = head + b"startxref" + tail.replace(offset, shifted, 1)
+        assert check_pdf_not_corrupted(misindexed) is True
+
+    def test_missing_startxref_fails(self):
+        """Test that a PDF whose trailer doesn't point at its cross-references fails."""
+        from tests.utils import create_basic_pdf
+
+        pdf_bytes = create_basic_pdf()
+        no_trailer = pdf_bytes[: pdf_bytes.rindex(b"startxref")] + b"%%EOF\n"
+        assert check_pdf_not_corrupted(no_trailer) is False
+
+
+class TestDisabledChecks:
+    """Test that optional checks pass PDFs they would fail once disabled."""
+
+    @pytest.mark.parametrize(
+        "check, option, fixture_name",
+        [
+            (check_pdf_links_https, "enforce_https", "http_link_pdf"),
+            (check_pdf_no_images, "no_images", "pdf_with_image"),
+            (check_pdf_background_white, "background_white", "colored_background_pdf"),
+            (
+                check_pdf_all_pixels_no_saturation,
+                "grayscale_colors",
+                "saturated_colors_pdf",
+            ),
+        ],
+    )
+    def test_check_disabled(self, request, check, option, fixture_name):
+        """Test that a check is skipped when its option is turned off."""
+        pdf_path = Path(request.getfixturevalue(fixture_name))
+        assert check(pdf_path, **{option: True}) is False
+        assert check(pdf_path, **{option: False}) is True
+
 
 class TestIntegration:
     """Integration tests for multiple checks."""
 
     def test_perfect_cv_passes_all_checks(self):
         """Test that a perfect CV passes all checks."""
-        from tests.utils import (
-            create_basic_pdf,
-            create_temp_pdf_file,
-            cleanup_temp_file,
-        )
+        from tests.utils import create_basic_pdf
 
         # Create a perfect CV
         pdf_bytes = create_basic_pdf(
@@ -337,58 +438,127 @@ class TestIntegration:
             title="Perfect CV",
             add_link="https://github.com/perfect-candidate",
         )
-        temp_file = create_temp_pdf_file(pdf_bytes)
-
-        try:
-            # All checks should pass
-            assert check_pdf_exists(Path(temp_file)) is True
-            assert check_pdf_page_count(Path(temp_file), max_pages=1) is True
-            assert check_pdf_file_size(Path(temp_file), max_file_size_kb=500) is True
-            assert (
-                check_pdf_font_sizes(Path(temp_file), min_size=8, max_size=21) is True
-            )
-            assert check_pdf_links_https(Path(temp_file), enforce_https=True) is True
-            assert check_pdf_no_images(Path(temp_file), no_images=True) is True
-            assert (
-                check_pdf_background_white(Path(temp_file), background_white=True)
-                is True
-            )
-            assert (
-                check_pdf_all_pixels_no_saturation(
-                    Path(temp_file), grayscale_colors=True
-                )
-                is True
-            )
-            assert check_pdf_spell_check(Path(temp_file), custom_words=[]) is True
-            assert check_pdf_structure(Path(temp_file)) is True
-            assert check_pdf_not_corrupted(Path(temp_file)) is True
-        finally:
-            cleanup_temp_file(temp_file)
+
+        # All checks should pass. They are independent, so run them together,
+        # against a single parse of the PDF.
+        pdf = ParsedPdf.from_bytes(pdf_bytes)
+        checks = {
+            "exists": lambda: check_pdf_exists(pdf),
+            "page_count": lambda: check_pdf_page_count(pdf, max_pages=1),
+            "file_size": lambda: check_pdf_file_size(pdf, max_file_size_kb=500),
+            "font_sizes": lambda: check_pdf_font_sizes(pdf, min_size=8, max_size=21),
+            "links_https": lambda: check_pdf_links_https(pdf, enforce_https=True),
+            "no_images": lambda: check_pdf_no_images(pdf, no_images=True),
+            "background_white": lambda: check_pdf_background_white(
+                pdf, background_white=True
+            ),
+            "no_saturation": lambda: check_pdf_all_pixels_no_saturation(
+                pdf, grayscale_colors=True
+            ),
+            "spell_check": lambda: check_pdf_spell_check(pdf, custom_words=[]),
+            "structure": lambda: check_pdf_structure(pdf),
+            "not_corrupted": lambda: check_pdf_not_corrupted(pdf),
+        }
+        with pdf, ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {name: executor.submit(check) for name, check in checks.items()}
+            results = {name: future.result() for name, future in futures.items()}
+
+        assert results == dict.fromkeys(checks, True)
 
     def test_problematic_cv_fails_multiple_checks(self):
         """Test that a problematic CV fails multiple checks."""
-        from tests.utils import (
-            create_font_size_test_pdf,
-            create_temp_pdf_file,
-            cleanup_temp_file,
-        )
+        from tests.utils import create_font_size_test_pdf
 
         # Create a problematic CV with multiple issues
         pdf_bytes = create_font_size_test_pdf(
             small_font=6, large_font=24, include_normal=False  # Too small  # Too large
         )
-        temp_file = create_temp_pdf_file(pdf_bytes)
-
-        try:
-            # These should pass
-            assert check_pdf_exists(Path(temp_file)) is True
-            assert check_pdf_page_count(Path(temp_file), max_pages=1) is True
-            assert check_pdf_structure(Path(temp_file)) is True
-            assert check_pdf_not_corrupted(Path(temp_file)) is True
-
-            # This should fail due to font size issues
-            assert (
-                check_pdf_font_sizes(Path(temp_file), min_size=8, max_size=21) is False
-            )
-        finally:
-            cleanup_temp_file(temp_file)
+
+        # These should pass
+        assert check_pdf_exists(pdf_bytes) is True
+        assert check_pdf_page_count(pdf_bytes, max_pages=1) is True
+        assert check_pdf_structure(pdf_bytes) is True
+        assert check_pdf_not_corrupted(pdf_bytes) is True
+
+        # This should fail due to font size issues
+        assert check_pdf_font_sizes(pdf_bytes, min_size=8, max_size=21) is False
+
+    def test_run_validation_reports_every_criterion_in_order(self, valid_pdf):
+        """Test that run_validation runs each criterion once and keeps their order."""
+        config = ValidationConfig(pdf_path=Path(valid_pdf))
+        reported = []
+
+        results = run_validation(config, on_result=reported.append)
+
+        names = [c.name for c in create_criteria_list(config)]
+        assert [r["name"] for r in results] == names
+        assert sorted(r["name"] for r in reported) == sorted(names)
+        assert all(r["passed"] for r in results)
+
+    def test_fail_fast_skips_criteria_once_score_is_unreachable(self, multi_page_pdf):
+        """Test that fail-fast stops early without changing the pass/fail outcome."""
+        config = ValidationConfig(pdf_path=Path(multi_page_pdf))
+
+        full = run_validation(config)
+        fast = run_validation(config, fail_below=100.0)
+
+        assert [r["name"] for r in fast] == [r["name"] for r in full]
+        assert not all(r["passed"] for r in full)
+        skipped = [r for r in fast if r["error"] and r["error"].startswith("Skipped")]
+        assert skipped
+        # Only expensive criteria are left once a cheap one has failed
+        costs = {c.name: c.cost for c in create_criteria_list(config)}
+        assert max(costs[r["name"]] for r in fast if r not in skipped) <= min(
+            costs[r["name"]] for r in skipped
+        )
+
+    def test_thread_unsafe_criteria_run_on_the_calling_thread(self, valid_pdf):
+        """Test that criteria not marked thread-safe stay off the worker threads."""
+        import threading
+
+        config = ValidationConfig(pdf_path=Path(valid_pdf))
+        threads = {}
+
+        def record(name):
+            def check(pdf):
+                threads[name] = threading.current_thread()
+                return True
+
+            return check
+
+        criteria = [
+            Criterion("Shared", "", record("Shared"), 1.0),
+            Criterion("Exclusive", "", record("Exclusive"), 1.0, thread_safe=False),
+        ]
+        results = run_validation(config, criteria)
+
+        assert [r["name"] for r in results] == ["Shared", "Exclusive"]
+        assert threads["Exclusive"] is threading.current_thread()
+        assert threads["Shared"] is not threading.current_thread()
+
+    def test_default_run_renders_only_what_it_needs(self, tmp_path, rendered_pages):
+        """Test that a full run on a gray multi-page PDF renders just page one."""
+        from tests.utils import create_basic_pdf
+
+        pdf_path = tmp_path / "cv.pdf"
+        pdf_path.write_bytes(create_basic_pdf(pages=5))
+
+        run_validation(ValidationConfig(pdf_path=pdf_path))
+
+        # The background check looks at the first page; the saturation check
+        # can tell every page is gray from its content stream
+        assert rendered_pages == [0]
+
+    def test_missing_file_fails_every_criterion_without_running_it(self):
+        """Test that run_validation doesn't invoke checks for a missing PDF."""
+        calls = []
+        criteria = [
+            Criterion("Recorded", "", lambda pdf: calls.append(pdf) or True, 1.0)
+        ]
+        config = ValidationConfig(pdf_path=Path("/nonexistent/file.pdf"))
+
+        results = run_validation(config, criteria)
+
+        assert calls == []
+        assert results[0]["passed"] is False
+        assert "not found" in results[0]["error"]
@@ -1,19 +1,37 @@
 """Utility functions for generating test PDFs."""
 
-import tempfile
-import os
-from pathlib import Path
-from typing import Optional, List, Tuple
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.colors import Color, black, white, red, blue
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.lib.units import inch
-from pypdf import PdfWriter, PdfReader
-import io
+import functools
+from typing import Optional, Tuple
+import fitz
 
+# RGB components in the range 0-1, as PyMuPDF takes them
+Color = Tuple[float, float, float]
 
+black: Color = (0, 0, 0)
+red: Color = (1, 0, 0)
+blue: Color = (0, 0, 1)
+
+# US Letter, in points
+PAGE_WIDTH = 612
+PAGE_HEIGHT = 792
+
+
+@functools.lru_cache(maxsize=None)
+def _solid_png(size: int, rgb: Tuple[int, int, int]) -> bytes:
+    """A size x size PNG filled with one color, encoded once per color and size."""
+    pixmap = fitz.Pixmap(fitz.csRGB, size, size, bytes(rgb) * (size * size), False)
+    return pixmap.tobytes("png")
+
+
+# The start of a PDF, cut off in the middle of its first object
+_CORRUPTED_PDF = b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n1 0 obj\n<< /Type /Catalog /Pages 2 0 R"
+
+
+# The builders below return immutable bytes and take hashable arguments, so
+# they are memoized: fixtures and tests asking for the same PDF share one build.
+
+
+@functools.lru_cache(maxsize=None)
 def create_basic_pdf(
     text: str = "Sample CV Text",
     font_size: int = 12,
@@ -43,71 +61,70 @@ def create_basic_pdf(
     Returns:
         PDF content as bytes
     """
-    buffer = io.BytesIO()
+    # A corrupted PDF is the same whatever it would have contained
+    if corrupt:
+        return _CORRUPTED_PDF
 
-    # Create canvas
-    c = canvas.Canvas(buffer, pagesize=letter)
+    doc = fitz.open()
 
     # Set metadata
-    c.setAuthor(author)
-    c.setTitle(title)
+    doc.set_metadata({"author": author, "title": title})
 
     for page_num in range(pages):
+        page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+
         # Set background color if specified
         if background_color:
-            c.setFillColor(background_color)
-            c.rect(0, 0, letter[0], letter[1], fill=1)
-
-        # Set text color and font
-        c.setFillColor(text_color)
-        c.setFont("Helvetica", font_size)
+            page.draw_rect(page.rect, color=None, fill=background_color)
 
         # Add text
-        y_position = letter[1] - 100  # Start near top
+        y_position = 100  # Start near top
         page_text = f"{text} - Page {page_num + 1}" if pages > 1 else text
-        c.drawString(100, y_position, page_text)
+        page.insert_text(
+            (100, y_position),
+            page_text,
+            fontname="helv",
+            fontsize=font_size,
+            color=text_color,
+        )
 
         # Add link if specified
         if add_link:
-            c.linkURL(add_link, (100, y_position - 20, 300, y_position), relative=1)
-            c.drawString(100, y_position - 20, f"Link: {add_link}")
+            page.insert_link(
+                {
+                    "kind": fitz.LINK_URI,
+                    "from": fitz.Rect(100, y_position, 300, y_position + 20),
+                    "uri": add_link,
+                }
+            )
+            page.insert_text(
+                (100, y_position + 20),
+                f"Link: {add_link}",
+                fontname="helv",
+                fontsize=font_size,
+                color=text_color,
+            )
 
         # Add image if specified (create actual image object)
         if add_image:
-            from reportlab.lib.utils import ImageReader
-            from PIL import Image as PILImage
-            import io as image_io
-
-            # Create a small PIL image
-            img = PILImage.new("RGB", (50, 50), color="red")
-            img_buffer = image_io.BytesIO()
-            img.save(img_buffer, format="PNG")
-            img_buffer.seek(0)
-
-            # Add the image to the PDF
-            c.drawImage(
-                ImageReader(img_buffer), 100, y_position - 100, width=50, height=50
+            page.insert_image(
+                fitz.Rect(100, y_position + 50, 150, y_position + 100),
+                stream=_solid_png(50, (255, 0, 0)),
             )
 
-        # Start new page if not the last one
-        if page_num < pages - 1:
-            c.showPage()
-
-    c.save()
-
-    pdf_bytes = buffer.getvalue()
-    buffer.close()
-
-    # Corrupt the PDF if requested
-    if corrupt:
-        # Truncate the PDF to make it corrupted
-        pdf_bytes = pdf_bytes[: len(pdf_bytes) // 2]
+    pdf_bytes = doc.tobytes()
+    doc.close()
 
     return pdf_bytes
 
 
+@functools.lru_cache(maxsize=None)
 def create_large_pdf(target_size_kb: float = 600) -> bytes:
-    """Create a PDF that exceeds the size limit.
+    """Create a valid one-page PDF of about the target size.
+
+    Only the file size matters to the tests using this, so rather than laying
+    out many pages, the PDF's XMP metadata is padded with whitespace, as XMP
+    allows for in-place editing.
 
     Args:
         target_size_kb: Target size in KB
@@ -115,54 +132,30 @@ def create_large_pdf(target_size_kb: float = 600) -> bytes:
     Returns:
         PDF content as bytes
     """
-    # Create a PDF with lots of text and images to make it large
-    large_text = (
-        "This is a very long text that will be repeated many times to make the PDF large. "
-        * 5000
-    )
-
-    buffer = io.BytesIO()
-    c = canvas.Canvas(buffer, pagesize=letter)
-    c.setAuthor("Test Author")
-    c.setTitle("Large Test PDF")
-
-    # Add many pages with lots of text and images
-    for page in range(50):  # Many more pages
-        c.setFont("Helvetica", 12)
-        y_position = letter[1] - 50
-
-        # Add text in chunks
-        text_chunks = [large_text[i : i + 70] for i in range(0, len(large_text), 70)]
-        for chunk in text_chunks[:80]:  # More text per page
-            if y_position < 50:
-                break
-            c.drawString(50, y_position, chunk)
-            y_position -= 10
-
-        # Add some images to increase file size
-        if page % 5 == 0:  # Every 5th page
-            from reportlab.lib.utils import ImageReader
-            from PIL import Image as PILImage
-            import io as image_io
-
-            # Create a larger image
-            img = PILImage.new("RGB", (200, 200), color="blue")
-            img_buffer = image_io.BytesIO()
-            img.save(img_buffer, format="PNG")
-            img_buffer.seek(0)
-
-            # Add the image to the PDF
-            c.drawImage(ImageReader(img_buffer), 400, 400, width=100, height=100)
-
-        c.showPage()
-
-    c.save()
-    pdf_bytes = buffer.getvalue()
-    buffer.close()
+    doc = fitz.open()
+    doc.set_metadata({"author": "Test Author", "title": "Large Test PDF"})
+    page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+    page.insert_text((100, 100), "This PDF is padded", fontname="helv", fontsize=12)
+
+    def set_padding(padding: int) -> None:
+        doc.set_xml_metadata(
+            '<x:xmpmeta xmlns:x="adobe:ns:meta/"/>'
+            + " " * padding
+            + '<?xpacket end="w"?>'
+        )
+
+    # Measure the PDF with an empty packet, then pad it up to the target
+    set_padding(0)
+    unpadded_size = len(doc.tobytes())
+    set_padding(max(0, int(target_size_kb * 1024) - unpadded_size))
+
+    pdf_bytes = doc.tobytes()
+    doc.close()
 
     return pdf_bytes
 
 
+@functools.lru_cache(maxsize=None)
 def create_font_size_test_pdf(
     small_font: int = 6, large_font: int = 24, include_normal: bool = True
 ) -> bytes:
@@ -176,35 +169,46 @@ def create_font_size_test_pdf(
     Returns:
         PDF content as bytes
     """
-    buffer = io.BytesIO()
-    c = canvas.Canvas(buffer, pagesize=letter)
-    c.setAuthor("Test Author")
-    c.setTitle("Font Size Test PDF")
+    doc = fitz.open()
+    doc.set_metadata({"author": "Test Author", "title": "Font Size Test PDF"})
+    page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
 
-    y_position = letter[1] - 100
+    y_position = 100
 
     # Add small font text
-    c.setFont("Helvetica", small_font)
-    c.drawString(100, y_position, f"This text is {small_font}pt (too small)")
-    y_position -= 50
+    page.insert_text(
+        (100, y_position),
+        f"This text is {small_font}pt (too small)",
+        fontname="helv",
+        fontsize=small_font,
+    )
+    y_position += 50
 
     # Add large font text
-    c.setFont("Helvetica", large_font)
-    c.drawString(100, y_position, f"This text is {large_font}pt (too large)")
-    y_position -= 50
+    page.insert_text(
+        (100, y_position),
+        f"This text is {large_font}pt (too large)",
+        fontname="helv",
+        fontsize=large_font,
+    )
+    y_position += 50
 
     # Add normal font text if requested
     if include_normal:
-        c.setFont("Helvetica", 12)
-        c.drawString(100, y_position, "This text is 12pt (normal)")
+        page.insert_text(
+            (100, y_position),
+            "This text is 12pt (normal)",
+            fontname="helv",
+            fontsize=12,
+        )
 
-    c.save()
-    pdf_bytes = buffer.getvalue()
-    buffer.close()
+    pdf_bytes = doc.tobytes()
+    doc.close()
 
     return pdf_bytes
 
 
+@functools.lru_cache(maxsize=None)
 def create_colored_pdf(use_saturated_colors: bool = True) -> bytes:
     """Create a PDF with colored elements.
 
@@ -214,120 +218,143 @@ def create_colored_pdf(use_saturated_colors: bool = True) -> bytes:
     Returns:
         PDF content as bytes
     """
-    buffer = io.BytesIO()
-    c = canvas.Canvas(buffer, pagesize=letter)
-    c.setAuthor("Test Author")
-    c.setTitle("Colored Test PDF")
+    doc = fitz.open()
+    doc.set_metadata({"author": "Test Author", "title": "Colored Test PDF"})
+    page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
 
     if use_saturated_colors:
-        # Use bright red background
-        c.setFillColor(red)
-        c.rect(0, 0, letter[0], letter[1], fill=1)
-
-        # Blue text
-        c.setFillColor(blue)
+        # Bright red background, blue text
+        background, text_color = red, blue
     else:
-        # Use grayscale colors
-        gray_bg = Color(0.9, 0.9, 0.9)  # Light gray
-        c.setFillColor(gray_bg)
-        c.rect(0, 0, letter[0], letter[1], fill=1)
-
-        # Dark gray text
-        c.setFillColor(Color(0.2, 0.2, 0.2))
-
-    c.setFont("Helvetica", 12)
-    c.drawString(100, letter[1] - 100, "This PDF has colored elements")
+        # Light gray background, dark gray text
+        background, text_color = (0.9, 0.9, 0.9), (0.2, 0.2, 0.2)
+
+    page.draw_rect(page.rect, color=None, fill=background)
+    page.insert_text(
+        (100, 100),
+        "This PDF has colored elements",
+        fontname="helv",
+        fontsize=12,
+        color=text_color,
+    )
 
-    c.save()
-    pdf_bytes = buffer.getvalue()
-    buffer.close()
+    pdf_bytes = doc.tobytes()
+    doc.close()
 
     return pdf_bytes
 
 
-def create_pdf_with_spelling_errors() -> bytes:
-    """Create a PDF with intentional spelling errors.
+@functools.lru_cache(maxsize=None)
+def create_pdf_with_edge_band(band_color: Color = red) -> bytes:
+    """Create a white-background PDF with a colored band along the bottom edge.
+
+    Args:
+        band_color: Color of the band
 
     Returns:
         PDF content as bytes
     """
-    # Text with spelling errors
-    text_with_errors = """
-    This is a sampel CV with some mispelled words.
-    I have experiance in sofware development.
-    My skils include programing and databse management.
-    I am very entusiastic about tecnology.
-    """
+    doc = fitz.open()
+    doc.set_metadata({"author": "Test Author", "title": "Edge Band Test PDF"})
+    page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
 
-    buffer = io.BytesIO()
-    c = canvas.Canvas(buffer, pagesize=letter)
-    c.setAuthor("Test Author")
-    c.setTitle("Spelling Test PDF")
+    # Half an inch tall
+    band = fitz.Rect(0, PAGE_HEIGHT - 36, PAGE_WIDTH, PAGE_HEIGHT)
+    page.draw_rect(band, color=None, fill=band_color)
 
-    c.setFont("Helvetica", 12)
-    y_position = letter[1] - 100
-
-    # Split text into lines and add to PDF
-    lines = text_with_errors.strip().split("\n")
-    for line in lines:
-        line = line.strip()
-        if line:
-            c.drawString(100, y_position, line)
-            y_position -= 20
+    page.insert_text(
+        (100, 100), "This PDF has a colored footer band", fontname="helv", fontsize=12
+    )
 
-    c.save()
-    pdf_bytes = buffer.getvalue()
-    buffer.close()
+    pdf_bytes = doc.tobytes()
+    doc.close()
 
     return pdf_bytes
 
 
-def create_pdf_without_metadata() -> bytes:
-    """Create a PDF without proper metadata.
+@functools.lru_cache(maxsize=None)
+def create_pdf_with_colored_page(pages: int = 5, colored_page: int = 2) -> bytes:
+    """Create a grayscale PDF with a single page that uses color.
+
+    Args:
+        pages: Number of pages
+        colored_page: Index of the page whose text is red
 
     Returns:
         PDF content as bytes
     """
-    buffer = io.BytesIO()
-    c = canvas.Canvas(buffer, pagesize=letter)
-
-    # Explicitly set empty metadata
-    c.setAuthor("")
-    c.setTitle("")
-    c.setSubject("")
-    c.setCreator("")
-
-    c.setFont("Helvetica", 12)
-    c.drawString(100, letter[1] - 100, "This PDF has no metadata")
+    doc = fitz.open()
+    doc.set_metadata({"author": "Test Author", "title": "Colored Page Test PDF"})
 
-    c.save()
-    pdf_bytes = buffer.getvalue()
-    buffer.close()
+    for page_num in range(pages):
+        page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+        page.insert_text(
+            (100, 100),
+            f"Page {page_num + 1}",
+            fontname="helv",
+            fontsize=12,
+            color=red if page_num == colored_page else black,
+        )
+
+    pdf_bytes = doc.tobytes()
+    doc.close()
 
     return pdf_bytes
 
 
-def create_temp_pdf_file(pdf_bytes: bytes) -> str:
-    """Create a temporary PDF file from bytes.
+# Text with spelling errors, one line per entry
+_SPELLING_ERROR_LINES = (
+    "This is a sampel CV with some mispelled words.",
+    "I have experiance in sofware development.",
+    "My skils include programing and databse management.",
+    "I am very entusiastic about tecnology.",
+)
 
-    Args:
-        pdf_bytes: PDF content as bytes
+
+@functools.lru_cache(maxsize=None)
+def create_pdf_with_spelling_errors() -> bytes:
+    """Create a PDF with intentional spelling errors.
 
     Returns:
-        Path to temporary PDF file
+        PDF content as bytes
     """
-    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp_file:
-        tmp_file.write(pdf_bytes)
-        return tmp_file.name
+    doc = fitz.open()
+    doc.set_metadata({"author": "Test Author", "title": "Spelling Test PDF"})
+    page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+
+    # All lines in one call, 20pt apart
+    page.insert_text(
+        (100, 100),
+        _SPELLING_ERROR_LINES,
+        fontname="helv",
+        fontsize=12,
+        lineheight=20 / 12,
+    )
+
+    pdf_bytes = doc.tobytes()
+    doc.close()
 
+    return pdf_bytes
 
-def cleanup_temp_file(file_path: str) -> None:
-    """Clean up a temporary file.
 
-    Args:
-        file_path: Path to file to delete
+@functools.lru_cache(maxsize=None)
+def create_pdf_without_metadata() -> bytes:
+    """Create a PDF without proper metadata.
+
+    Returns:
+        PDF content as bytes
     """
-    try:
-        os.unlink(file_path)
-    except (OSError, FileNotFoundError):
-        pass  # File already deleted or doesn't exist
+    doc = fitz.open()
+
+    # Explicitly set empty metadata
+    doc.set_metadata({"author": "", "title": "", "subject": "", "creator": ""})
+
+    page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+    page.insert_text(
+        (100, 100), "This PDF has no metadata", fontname="helv", fontsize=12
+    )
+
+    pdf_bytes = doc.tobytes()
+    doc.close()
+
+    return pdf_bytes